@@ -1,13 +1,131 @@
+import asyncio
+import itertools
 import os
-from typing import Union
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Iterable, Iterator, Literal, Optional, Union
+from urllib.parse import urlencode
 from datetime import datetime
 import logging
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import boto3
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError, PartialCredentialsError
 from dotenv import load_dotenv
 
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:  # aiobotocore is only needed for AsyncS3Connection
+    AioConfig = None
+    get_session = None
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+GB = 1024 * MB
+
+# Rows converted to Arrow at a time when serializing a DataFrame to CSV
+_CSV_BATCH_ROWS = 100_000
+
+# Connections kept open by the shared S3 client
+_MAX_POOL_CONNECTIONS = 64
+
+# Largest object a single CopyObject request can copy
+_MAX_COPY_OBJECT_SIZE = 5 * GB
+
+# Attributes of a source object that a multipart copy has to set again on the new object
+_COPY_EXTRA_ARGS = ('ContentType', 'Metadata', 'CacheControl', 'ContentEncoding', 'ContentDisposition',
+                    'ContentLanguage', 'StorageClass', 'ServerSideEncryption', 'SSEKMSKeyId')
+
+_DOTENV_LOADED = False
+_REGION = None
+
+_SESSION = None
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+# Arrow CSV options that follow pd.read_csv's defaults for missing values and booleans
+_PANDAS_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    strings_can_be_null=True,
+    null_values=['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                 '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'],
+    true_values=['True', 'TRUE', 'true'],
+    false_values=['False', 'FALSE', 'false'])
+
+
+def _temporal_to_string(table: pa.Table) -> pa.Table:
+    """
+    Turn the date, time and timestamp columns Arrow inferred back into strings, as pandas leaves them.
+
+    :param table: The table read by Arrow's CSV reader
+    :return: The table with every temporal column cast to string
+    """
+    for i, field in enumerate(table.schema):
+        if pa.types.is_temporal(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.string()))
+    return table
+
+
+def _ensure_env() -> None:
+    """
+    Load the `.env` file and resolve environment settings, once per process.
+
+    :return: None
+    """
+    global _DOTENV_LOADED, _REGION
+    if not _DOTENV_LOADED:
+        load_dotenv()
+        _REGION = os.getenv("AWS_REGION", "us-east-1")
+        _DOTENV_LOADED = True
+
+
+def _get_credentials() -> dict:
+    """
+    Read the AWS credentials and region from environment variables.
+
+    :return: Keyword arguments for creating a boto3 or aiobotocore session/client
+    """
+    _ensure_env()
+    access_key = os.getenv("access_key")
+    secret_key = os.getenv("secret_access_key")
+    region_name = os.getenv("region_name", "us-east-1")  # Default to 'us-east-1' if not set)
+
+    if not access_key or not secret_key:
+        raise ValueError("AWS credentials are not set in the environment variables.")
+
+    return {'aws_access_key_id': access_key, 'aws_secret_access_key': secret_key, 'region_name': region_name}
+
+
+def _get_client():
+    """
+    Return the S3 client shared by every S3Connection in this process.
+
+    The boto3 session and client are built on first use only, so credential resolution, SSL setup
+    and the connection pool are reused across instances and threads.
+
+    :return: A boto3 S3 client
+    """
+    global _SESSION, _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _SESSION = boto3.session.Session(**_get_credentials())
+                # Adaptive retries back off on throttling (503 SlowDown) before an error reaches the caller.
+                # The pool must hold at least as many connections as the TransferConfig max_concurrency,
+                # otherwise parallel parts wait on each other for a connection.
+                _CLIENT = _SESSION.client('s3', config=Config(max_pool_connections=_MAX_POOL_CONNECTIONS,
+                                                              tcp_keepalive=True, connect_timeout=3, read_timeout=60,
+                                                              retries={'mode': 'adaptive', 'max_attempts': 10}))
+    return _CLIENT
+
 
 class S3Connection:
     def __init__(self) -> None:
@@ -17,24 +135,27 @@ class S3Connection:
         This method loads AWS access keys (access_key, secret_key) from environment variables
         using `load_dotenv()`. If the credentials are not set, a ValueError is raised. If
         there is an issue creating the S3 client, it raises a ValueError with the error message.
+        The client is created once per process and shared by all instances.
 
         :return: None
         """
-        load_dotenv()
-        access_key = os.getenv("access_key")
-        secret_key = os.getenv("secret_access_key")
-        region_name = os.getenv("region_name", "us-east-1")  # Default to 'us-east-1' if not set)
-
-        if not access_key or not secret_key:
-            raise ValueError("AWS credentials are not set in the environment variables.")
-
+        _ensure_env()
         try:
-            # Create an S3 client using the provided credentials
-            self.client = boto3.client('s3', aws_access_key_id=access_key, aws_secret_access_key=secret_key,
-                                       region_name=region_name)
+            # Reuse the process-wide S3 client, creating it on first use
+            self.client = _get_client()
+        except ValueError:
+            raise
         except Exception as e:
             raise ValueError(f"Failed to create S3 client: {e}")
 
+        # Transfer settings shared by all uploads: objects above the threshold are split into parts
+        # that are uploaded in parallel, and a failed part is retried on its own
+        self._xfer_cfg = TransferConfig(multipart_threshold=8 * MB, multipart_chunksize=16 * MB,
+                                        max_concurrency=10, use_threads=True)
+        # Downloads use larger ranged GETs and more threads to saturate the link on multi-GB objects
+        self._download_cfg = TransferConfig(multipart_threshold=16 * MB, multipart_chunksize=64 * MB,
+                                            max_concurrency=16, use_threads=True)
+
     def create_bucket(self, bucket_name: str) -> bool:
         """
         Create a new S3 bucket in the specified region.
@@ -42,20 +163,24 @@ class S3Connection:
         :param bucket_name: The name of the bucket to create
         :return: True if the bucket was created, False if there was an error
         """
-        # Check if the bucket already exists
-        list_of_buckets = self.client.list_buckets().get("Buckets")
+        # Check if the bucket already exists with a single HEAD request
+        try:
+            self.client.head_bucket(Bucket=bucket_name)
+            exists = True
+        except ClientError as e:
+            # Anything other than "not found" (e.g. 403 for a bucket owned elsewhere) means the name is taken
+            exists = e.response['Error']['Code'] not in ('404', 'NoSuchBucket', 'NotFound')
 
         # If the bucket name already exists, modify the name to make it unique
-        if bucket_name in [bucket.get("Name") for bucket in list_of_buckets]:
-            name = str(datetime.now()).split()[0]
-            name = "".join(name.split("-"))
-            bucket_name = f"{bucket_name}-{name}"
+        if exists:
+            suffix = datetime.now().strftime('%Y%m%d')
+            bucket_name = f"{bucket_name}-{suffix}"
 
-        # Print the new bucket name for clarity
-        print(f"Bucket name: {bucket_name}")
+        # Log the new bucket name for clarity
+        logger.info("Bucket name: %s", bucket_name)
 
-        # Get the AWS region
-        region = os.getenv("AWS_REGION", "us-east-1")
+        # Get the AWS region resolved when the environment was loaded
+        region = _REGION
 
         try:
             # Create the bucket with location constraint if the region is not us-east-1
@@ -66,10 +191,10 @@ class S3Connection:
                     Bucket=bucket_name,
                     CreateBucketConfiguration={'LocationConstraint': region}
                 )
-            print(f"Bucket {bucket_name} created successfully in region {region}.")
+            logger.info("Bucket %s created successfully in region %s.", bucket_name, region)
             return True
-        except Exception as e:
-            print(f"Error creating bucket: {str(e)}")
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error creating bucket: %s", e)
             return False
 
     def get_all_buckets(self)->list:
@@ -95,14 +220,33 @@ class S3Connection:
 
         try:
             self.client.delete_bucket(Bucket=bucket_name)
-            print(f"Bucket {bucket_name} deleted successfully.")
+            logger.info("Bucket %s deleted successfully.", bucket_name)
             return True
-        except Exception as e:
-            print(f"Error deleting bucket: {str(e)}")
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error deleting bucket: %s", e)
         return False
 
-    def read_file_to_df(self, bucket_name: str, key: str) -> Union[pd.DataFrame, None]:
-        """Reads a CSV file from an S3 bucket and returns it as a pandas DataFrame."""
+    def read_file_to_df(self, bucket_name: str, key: str, chunksize: Optional[int] = None) \
+            -> Union[pd.DataFrame, Iterator[pd.DataFrame], None]:
+        """
+        Reads a CSV or Parquet file from an S3 bucket and returns it as a pandas DataFrame.
+
+        Keys ending in `.parquet` are read as Parquet, anything else as CSV. The object body is
+        parsed straight from the response stream. When `chunksize` is given,
+        an iterator of DataFrames with at most `chunksize` rows each is returned instead, so the
+        whole file never has to be held in memory at once.
+
+        Without `chunksize`, CSV files are parsed by Arrow with pandas' rules for missing values and
+        booleans, and dates and times are left as strings, so the result matches `pd.read_csv`.
+        One difference remains: Arrow rewrites time and timestamp values in its own format before
+        they are turned back into strings, so `10:00` reads as `10:00:00` and
+        `2024-01-01T10:00` as `2024-01-01 10:00:00`. Dates (`YYYY-MM-DD`) are unchanged.
+
+        :param bucket_name: The S3 bucket name
+        :param key: The CSV or Parquet file in the bucket
+        :param chunksize: Number of rows per DataFrame chunk, or None to read the whole file
+        :return: A DataFrame, an iterator of DataFrames, or None if an error occurred
+        """
         try:
             # Fetch the object from S3
             response = self.client.get_object(Bucket=bucket_name, Key=key)
@@ -112,38 +256,97 @@ class S3Connection:
             if status_code != 200:
                 raise ValueError(f"Failed to retrieve object. Status code: {status_code}")
 
-            # Read the CSV file from the response body
-            df = pd.read_csv(response['Body'])
-            return df
+            if key.endswith('.parquet'):
+                # Parquet needs random access to its footer, so read the body into an Arrow buffer
+                parquet_file = pq.ParquetFile(pa.BufferReader(response['Body'].read()))
+                if chunksize:
+                    return (batch.to_pandas() for batch in parquet_file.iter_batches(batch_size=chunksize))
+                return parquet_file.read().to_pandas(self_destruct=True)
+
+            # Stream the CSV in row chunks when the caller asks for it
+            if chunksize:
+                return pd.read_csv(response['Body'], chunksize=chunksize, iterator=True)
+
+            # Otherwise parse the response body with Arrow's multithreaded CSV reader
+            table = pa_csv.read_csv(response['Body'],
+                                    read_options=pa_csv.ReadOptions(use_threads=True, block_size=8 * MB),
+                                    convert_options=_PANDAS_CSV_CONVERT_OPTIONS)
+            return _temporal_to_string(table).to_pandas(self_destruct=True)
 
         except ClientError as e:
             # Specific error handling for AWS S3 client errors
-            print(f"S3 ClientError: {e}")
+            logger.error("S3 ClientError: %s", e)
         except ValueError as e:
-            # Handle case where response status code is not 200
-            print(f"ValueError: {e}")
-        except Exception as e:
-            # Generic exception handling for any other errors
-            print(f"An unexpected error occurred: {e}")
+            # Handle case where response status code is not 200, or the file could not be parsed
+            logger.error("ValueError: %s", e)
+        except BotoCoreError as e:
+            # S3 could not be reached or timed out even after botocore's retries
+            logger.error("S3 connection error: %s", e)
 
         return None  # Return None if an error occurs
 
-    def delete_file(slef, bucket_name: str, object_name:str)->bool:
+    def iter_batches(self, bucket_name: str, key: str, batch_size: int = 64_000) -> Iterator[pa.RecordBatch]:
         """
-        Delete a file from an S3 bucket.
+        Stream a CSV or Parquet file from an S3 bucket as Arrow record batches.
+
+        CSV files are decoded block by block straight from the response stream, so only one batch
+        is held in memory at a time. Parquet files (keys ending in `.parquet`) are fetched whole,
+        since the format needs random access, but are decoded one batch at a time.
+        Call `to_pandas()` on a batch, or `pd.concat` the results, when a DataFrame is needed.
 
         :param bucket_name: The S3 bucket name
-        :param object_name: The file to delete
-        :return: True if the file was deleted, else False
+        :param key: The CSV or Parquet file in the bucket
+        :param batch_size: Maximum number of rows per batch
+        :return: An iterator of record batches
+        """
+        body = self.client.get_object(Bucket=bucket_name, Key=key)['Body']
+
+        if key.endswith('.parquet'):
+            yield from pq.ParquetFile(pa.BufferReader(body.read())).iter_batches(batch_size=batch_size)
+            return
+
+        reader = pa_csv.open_csv(body, read_options=pa_csv.ReadOptions(block_size=8 * MB))
+        while True:
+            try:
+                batch = reader.read_next_batch()
+            except StopIteration:
+                break
+            # CSV blocks are sized in bytes, so split them to honour the row limit
+            for offset in range(0, batch.num_rows, batch_size):
+                yield batch.slice(offset, batch_size)
+
+    def select(self, bucket_name: str, key: str, sql: str) -> Union[pd.DataFrame, None]:
         """
+        Run an S3 Select query against a CSV file and return the result as a pandas DataFrame.
 
+        The projection and filter run inside S3, so only the matching rows and columns are
+        transferred and parsed. The CSV header is used for column names, e.g.
+        `SELECT s.col1, s.col2 FROM S3Object s WHERE s.year = '2024'`.
+
+        :param bucket_name: The S3 bucket name
+        :param key: The CSV file in the bucket
+        :param sql: The S3 Select SQL expression
+        :return: A DataFrame with the query result, or None if an error occurred
+        """
         try:
-            self.client.delete_object(Bucket=bucket_name, Key=object_name)
-            print(f"File {object_name} deleted from {bucket_name}")
-            return True
-        except Exception as e:
-            print(f"Error deleting file: {str(e)}")
-        return False
+            # Request JSON lines back so the selected column names are kept
+            response = self.client.select_object_content(
+                Bucket=bucket_name, Key=key, Expression=sql, ExpressionType='SQL',
+                InputSerialization={'CSV': {'FileHeaderInfo': 'USE'}, 'CompressionType': 'NONE'},
+                OutputSerialization={'JSON': {'RecordDelimiter': '\n'}})
+
+            records = BytesIO()
+            for event in response['Payload']:
+                if 'Records' in event:
+                    records.write(event['Records']['Payload'])
+
+            if not records.tell():
+                return pd.DataFrame()
+            records.seek(0)
+            return pd.read_json(records, lines=True)
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error selecting from %s: %s", key, e)
+        return None
 
     def get_object_metadata(self, bucket_name: str, key: str) -> Union[dict, None]:
         """
@@ -153,14 +356,12 @@ class S3Connection:
         :param key: The object in the bucket
         :return: Metadata dictionary or None if error occurred
         """
-        self.client = get_client("s3")
-
         try:
             response = self.client.head_object(Bucket=bucket_name, Key=key)
-            print(f"Metadata for {key}: {response}")
+            logger.debug("Metadata for %s: %s", key, response)
             return response
-        except Exception as e:
-            print(f"Error getting metadata: {str(e)}")
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error getting metadata: %s", e)
         return None
 
     def copy_object(self, source_bucket: str, source_object: str, destination_bucket: str, destination_object: str)\
@@ -168,6 +369,10 @@ class S3Connection:
         """
         Copy an object from one S3 bucket to another.
 
+        Objects are copied server-side with `CopyObject`. Objects above its 5 GB limit are copied
+        with parallel server-side part copies instead, carrying over the source's content headers,
+        metadata, storage class, encryption settings and tags.
+
         :param source_bucket: The source bucket name
         :param source_object: The object in the source bucket
         :param destination_bucket: The destination bucket name
@@ -176,13 +381,39 @@ class S3Connection:
         """
         try:
             copy_source = {'Bucket': source_bucket, 'Key': source_object}
-            self.client.copy_object(CopySource=copy_source, Bucket=destination_bucket, Key=destination_object)
-            print(f"Copied {source_object} from {source_bucket} to {destination_bucket}/{destination_object}")
+            head = self.client.head_object(Bucket=source_bucket, Key=source_object)
+            if head.get('ContentLength', 0) <= _MAX_COPY_OBJECT_SIZE:
+                self.client.copy_object(CopySource=copy_source, Bucket=destination_bucket, Key=destination_object)
+            else:
+                # A multipart copy starts a new object, so copy the source's attributes over explicitly
+                extra_args = {arg: head[arg] for arg in _COPY_EXTRA_ARGS if head.get(arg)}
+                tags = self.client.get_object_tagging(Bucket=source_bucket, Key=source_object).get('TagSet', [])
+                if tags:
+                    extra_args['Tagging'] = urlencode({tag['Key']: tag['Value'] for tag in tags})
+                self.client.copy(copy_source, destination_bucket, destination_object, ExtraArgs=extra_args,
+                                 Config=self._xfer_cfg)
+            logger.debug("Copied %s from %s to %s/%s",
+                         source_object, source_bucket, destination_bucket, destination_object)
             return True
-        except Exception as e:
-            print(f"Error copying object: {str(e)}")
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error copying object: %s", e)
         return False
 
+    def relocate(self, source_bucket: str, source_key: str, destination_bucket: str, destination_key: str) -> bool:
+        """
+        Place an unchanged copy of a file at a new location in S3.
+
+        Use this instead of `read_file_to_df` followed by `write_df` when the data is not transformed:
+        the copy happens server-side, so nothing is downloaded, parsed or re-uploaded.
+
+        :param source_bucket: The source bucket name
+        :param source_key: The file in the source bucket
+        :param destination_bucket: The destination bucket name
+        :param destination_key: The key for the file in the destination bucket
+        :return: True if the file was copied, else False
+        """
+        return self.copy_object(source_bucket, source_key, destination_bucket, destination_key)
+
 
     def upload_to_s3(self, data: Union[str, pd.DataFrame], bucket_name: str, key: str, is_dataframe: bool = False) -> bool:
         """
@@ -203,62 +434,158 @@ class S3Connection:
             bool: `True` if the file already exists in the bucket, `False` if the file is uploaded.
 
         Raises:
+            ClientError: If checking for the object fails for any reason other than it not existing.
             Exception: If there is an error during the S3 interaction (e.g., invalid credentials, network issues).
         """
         try:
             # Check if the object exists in the bucket
             self.client.head_object(Bucket=bucket_name, Key=key)
-            logging.info(f"File {key} already exists in bucket {bucket_name}.")
+            logger.debug("File %s already exists in bucket %s.", key, bucket_name)
             return True  # File exists
-        except Exception as e:
-            logging.info(f"File {key} not found, uploading a new file.")
+        except ClientError as e:
+            # Only a missing object should trigger an upload; throttling or server errors are re-raised
+            if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+                logger.error("Error checking file %s: %s", key, e)
+                raise
+            logger.debug("File %s not found, uploading a new file.", key)
             if is_dataframe:
                 # Handle DataFrame upload
-                csv_buffer = StringIO()
-                data.to_csv(csv_buffer, index=False)
-                csv_buffer.seek(0)
-                self.client.put_object(Bucket=bucket_name, Key=key, Body=csv_buffer.getvalue())
-                logging.info(f"DataFrame uploaded as {key} to bucket {bucket_name}.")
+                csv_buffer = self._df_to_csv_buffer(data)
+                self.client.upload_fileobj(csv_buffer, bucket_name, key, Config=self._xfer_cfg)
+                logger.debug("DataFrame uploaded as %s to bucket %s.", key, bucket_name)
             else:
                 # Handle file upload
-                self.client.upload_file(data, bucket_name, key)  # `data` is a file path here
-                logging.info(f"File {data} uploaded as {key} to bucket {bucket_name}.")
+                self.client.upload_file(data, bucket_name, key, Config=self._xfer_cfg)  # `data` is a file path here
+                logger.debug("File %s uploaded as %s to bucket %s.", data, key, bucket_name)
             return False  # File does not exist or uploaded
 
 
+    def upload_files(self, items: Iterable[tuple], workers: int = 32) -> list:
+        """
+        Upload many local files to S3 concurrently.
+
+        Existing objects are skipped. When the keys for a bucket share a prefix, they are found with
+        one listing of that prefix instead of a `head_object` call per file; otherwise each key is
+        checked with `head_object`. All files go through one transfer manager that shares this
+        connection's S3 client, so `workers` bounds the total number of requests in flight.
+
+        Params:
+            items (Iterable[tuple]): `(file_path, bucket_name, key)` tuples describing each upload.
+            workers (int): Maximum number of requests in flight, capped at the client's connection
+                pool size. Defaults to 32.
+
+        Returns:
+            list: `(bucket_name, key)` tuples of the files that were uploaded.
+
+        Raises:
+            ClientError: If checking which objects already exist fails, so nothing is overwritten by mistake.
+        """
+        items = list(items)
+        workers = min(workers, _MAX_POOL_CONNECTIONS)
+
+        existing = set()
+        for bucket_name in {bucket for _, bucket, _ in items}:
+            keys = [key for _, bucket, key in items if bucket == bucket_name]
+            prefix = os.path.commonprefix(keys)
+            if prefix:
+                # List the existing keys once, restricted to the prefix shared by the keys. Unlike list_files
+                # this lets errors propagate, so a failed listing is not mistaken for an empty prefix
+                existing.update((bucket_name, key) for key in self._list_prefix(bucket_name, prefix))
+            else:
+                # Without a shared prefix a listing would cover the whole bucket, so check each key instead
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    found = pool.map(lambda key: self._object_exists(bucket_name, key), keys)
+                    existing.update((bucket_name, key) for key, exists in zip(keys, found) if exists)
+
+        uploaded = []
+        config = TransferConfig(multipart_threshold=8 * MB, multipart_chunksize=16 * MB,
+                                max_concurrency=workers, use_threads=True)
+        with create_transfer_manager(self.client, config) as manager:
+            futures = [(manager.upload(path, bucket_name, key), path, bucket_name, key)
+                       for path, bucket_name, key in items if (bucket_name, key) not in existing]
+            for future, path, bucket_name, key in futures:
+                try:
+                    future.result()
+                    uploaded.append((bucket_name, key))
+                    logger.debug("File %s uploaded as %s to bucket %s.", path, key, bucket_name)
+                except (ClientError, BotoCoreError, OSError) as e:
+                    logger.error("Error uploading %s to bucket %s: %s", path, bucket_name, e)
+
+        return uploaded
+
+    def _object_exists(self, bucket_name: str, key: str) -> bool:
+        """
+        Check whether an object exists with a single `head_object` request.
+
+        :param bucket_name: The S3 bucket name
+        :param key: The object in the bucket
+        :return: True if the object exists, else False
+        """
+        try:
+            self.client.head_object(Bucket=bucket_name, Key=key)
+            return True
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+                raise
+        return False
+
     def download_file(self, bucket_name: str, key: str, file_path: str)->bool:
         """
         Download a file from an S3 bucket.
 
+        Files above 16 MB are fetched as parallel ranged GETs.
+
         :param bucket_name: The S3 bucket name
         :param key: The name of the file in the bucket
         :param file_path: Local path to save the file
         :return: True if the file was downloaded, else False
         """
         try:
-            self.client.download_file(bucket_name, key, file_path)
-            print(f"File downloaded successfully from {bucket_name}/{key} to {file_path}")
+            self.client.download_file(bucket_name, key, file_path, Config=self._download_cfg)
+            logger.debug("File downloaded successfully from %s/%s to %s", bucket_name, key, file_path)
             return True
-        except Exception as e:
-            print(f"Error downloading file: {str(e)}")
+        except (ClientError, BotoCoreError, OSError) as e:
+            logger.error("Error downloading file: %s", e)
         return False
 
-    def list_files(self, bucket_name: str)->list:
+    def list_files(self, bucket_name: str, prefixes: Optional[list] = None, max_workers: int = 16)->list:
         """
         List all files in an S3 bucket.
 
+        Every page of results is followed, so buckets with more than 1000 objects are listed in full.
+        When `prefixes` is given, only keys under those prefixes are listed, and each prefix is
+        paginated in its own thread since S3 scales request throughput per prefix.
+
         :param bucket_name: The S3 bucket name
+        :param prefixes: Optional list of key prefixes to list concurrently
+        :param max_workers: Maximum number of prefixes listed at the same time
         :return: List of files in the bucket
         """
 
         try:
-            response = self.client.list_objects_v2(Bucket=bucket_name)
-            files = [obj['Key'] for obj in response.get('Contents', [])]
-            return files
-        except Exception as e:
-            print(f"Error listing files: {str(e)}")
+            if not prefixes:
+                return self._list_prefix(bucket_name, "")
+
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(prefixes))) as pool:
+                pages = pool.map(lambda prefix: self._list_prefix(bucket_name, prefix), prefixes)
+                return [key for page in pages for key in page]
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error listing files: %s", e)
         return []
 
+    def _list_prefix(self, bucket_name: str, prefix: str) -> list:
+        """
+        List every key under a prefix, following continuation tokens.
+
+        :param bucket_name: The S3 bucket name
+        :param prefix: The key prefix, or an empty string for the whole bucket
+        :return: List of keys
+        """
+        paginator = self.client.get_paginator('list_objects_v2')
+        # Pages without any objects yield None from the search, so drop those
+        return [key for key in paginator.paginate(Bucket=bucket_name, Prefix=prefix).search('Contents[].Key')
+                if key is not None]
+
     def delete_file(self, bucket_name: str, key: str)->bool:
         """
         Delete a file from an S3 bucket.
@@ -267,17 +594,43 @@ class S3Connection:
         :param key: The file to delete
         :return: True if the file was deleted, else False
         """
+        return self.delete_files(bucket_name, [key])
+
+    def delete_files(self, bucket_name: str, keys: Iterable[str])->bool:
+        """
+        Delete many files from an S3 bucket.
+
+        Keys are sent in batches of up to 1000 per `DeleteObjects` request instead of one
+        request per file.
+
+        :param bucket_name: The S3 bucket name
+        :param keys: The files to delete
+        :return: True if every file was deleted, else False
+        """
+        keys_iter = iter(keys)
+        deleted = True
         try:
-            self.client.delete_object(Bucket=bucket_name, Key=key)
-            print(f"File {key} deleted from {bucket_name}")
-            return True
-        except Exception as e:
-            print(f"Error deleting file: {str(e)}")
+            while chunk := list(itertools.islice(keys_iter, 1000)):
+                response = self.client.delete_objects(Bucket=bucket_name,
+                                                      Delete={'Objects': [{'Key': k} for k in chunk], 'Quiet': True})
+                # In quiet mode only the keys that failed are reported back
+                for error in response.get('Errors', []):
+                    logger.error("Error deleting file %s: %s", error.get('Key'), error.get('Message'))
+                    deleted = False
+                logger.debug("Deleted %s files from %s", len(chunk) - len(response.get('Errors', [])), bucket_name)
+            return deleted
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error deleting files: %s", e)
         return False
 
-    def write_df(self, df: pd.DataFrame, bucket_name: str, key: str) -> bool:
+    def write_df(self, df: pd.DataFrame, bucket_name: str, key: str,
+                 fmt: Optional[Literal['csv', 'parquet']] = None) -> bool:
         """
-        Uploads a DataFrame as a CSV file to an S3 bucket.
+        Uploads a DataFrame as a Parquet or CSV file to an S3 bucket.
+
+        The format follows the key, the same way `read_file_to_df` picks it: keys ending in `.parquet`
+        are written as Parquet, anything else as CSV. Parquet files are written with Snappy compression,
+        which is much smaller on the wire than CSV for numeric data.
 
         If the file already exists in the S3 bucket, the method logs a message and returns `True`.
         If the file does not exist, it uploads the DataFrame as a new file to the S3 bucket and returns `False`.
@@ -286,46 +639,284 @@ class S3Connection:
             df (pd.DataFrame): The pandas DataFrame to upload.
             bucket_name (str): The name of the S3 bucket.
             key (str): The key (file path) for the object in the S3 bucket.
+            fmt (str): The file format to write, either 'parquet' or 'csv'. Defaults to the format implied by `key`.
 
         Returns:
             bool: `True` if the file already exists, `False` if the file was uploaded.
 
         Raises:
+            ValueError: If `fmt` is not a supported format, or does not match the suffix of `key`.
             ClientError: If there is an issue interacting with S3 (e.g., permission errors).
         """
+        key_fmt = 'parquet' if key.endswith('.parquet') else 'csv'
+        if fmt is None:
+            fmt = key_fmt
+        if fmt not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported format: {fmt}")
+        if fmt != key_fmt:
+            # read_file_to_df picks the format from the suffix, so the two have to agree
+            raise ValueError(f"Format {fmt} does not match key {key}; use a '.parquet' key for Parquet files.")
+
         try:
             # Check if the object exists in the bucket
             self.client.head_object(Bucket=bucket_name, Key=key)
-            logging.info(f"File {key} already exists in bucket {bucket_name}.")
+            logger.debug("File %s already exists in bucket %s.", key, bucket_name)
             return True  # File exists
         except ClientError as e:
-            # If the error code is 'NoSuchKey', it means the file does not exist
-            if e.response['Error']['Code'] == 'NoSuchKey':
-                logging.info(f"File {key} not found, uploading a new file.")
+            # HEAD requests report a missing object as '404' rather than 'NoSuchKey'
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                logger.debug("File %s not found, uploading a new file.", key)
             else:
-                logging.error(f"Error checking file {key}: {e}")
-                raise  # Re-raise the error if it wasn't a "NoSuchKey" error
+                logger.error("Error checking file %s: %s", key, e)
+                raise  # Re-raise the error if it wasn't a "not found" error
 
-            # Create an in-memory buffer for the CSV file
-            csv_buffer = StringIO()
-            # Copy the DataFrame to the in-memory buffer
-            df.to_csv(csv_buffer, index=False)
-            csv_buffer.seek(0)  # Rewind the buffer to the start before uploading
+            # Serialize the DataFrame in an Arrow buffer
+            if fmt == 'parquet':
+                file_buffer = self._df_to_parquet_buffer(df)
+            else:
+                file_buffer = self._df_to_csv_buffer(df)
 
-            # Upload the CSV to S3
+            # Upload the file to S3
             try:
-                self.client.put_object(Bucket=bucket_name, Key=key, Body=csv_buffer.getvalue())
-                logging.info(f"File {key} successfully uploaded to bucket {bucket_name}.")
+                self.client.upload_fileobj(file_buffer, bucket_name, key, Config=self._xfer_cfg)
+                logger.debug("File %s successfully uploaded to bucket %s.", key, bucket_name)
                 return False  # File does not exist, and now uploaded
             finally:
                 # Ensure that the buffer is closed to release resources
-                csv_buffer.close()
+                file_buffer.close()
+
+    @staticmethod
+    def _df_to_csv_buffer(df: pd.DataFrame) -> Union[pa.BufferReader, BytesIO]:
+        """
+        Serialize a DataFrame to CSV with Arrow's native writer.
+
+        The CSV bytes are written once into an Arrow buffer and read back through a zero-copy
+        file-like reader, so no intermediate Python string or `getvalue()` copy is made. The
+        DataFrame is converted to Arrow in slices of rows, so a full Arrow copy of it is never
+        held next to the CSV.
+        Arrow's CSV differs slightly from `df.to_csv`: booleans are written as `true`/`false`,
+        timestamps keep their full fractional seconds and string columns are always quoted.
+        DataFrames Arrow cannot convert (e.g. object columns mixing str and int, or duplicate
+        column names) fall back to `df.to_csv`.
+
+        :param df: The DataFrame to serialize
+        :return: A readable binary file object positioned at the start of the CSV
+        """
+        sink = pa.BufferOutputStream()
+        schema = None
+        writer = None
+        try:
+            # Always run once so an empty DataFrame still gets its header row
+            for start in range(0, max(len(df), 1), _CSV_BATCH_ROWS):
+                # Later slices reuse the first slice's schema so every row is written with the same types
+                table = pa.Table.from_pandas(df.iloc[start:start + _CSV_BATCH_ROWS], preserve_index=False,
+                                             schema=schema)
+                if writer is None:
+                    schema = table.schema
+                    writer = pa_csv.CSVWriter(sink, schema)
+                writer.write_table(table)
+            writer.close()
+            writer = None
+            return pa.BufferReader(sink.getvalue())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError) as e:
+            logger.debug("Falling back to pandas CSV writer: %s", e)
+        finally:
+            # Leave no writer open on the fallback path
+            if writer is not None:
+                writer.close()
+
+        csv_buffer = BytesIO()
+        df.to_csv(csv_buffer, index=False)
+        csv_buffer.seek(0)
+        return csv_buffer
+
+    @staticmethod
+    def _df_to_parquet_buffer(df: pd.DataFrame) -> pa.BufferReader:
+        """
+        Serialize a DataFrame to Snappy-compressed Parquet in an Arrow buffer.
+
+        :param df: The DataFrame to serialize
+        :return: A readable binary file object positioned at the start of the Parquet file
+        """
+        sink = pa.BufferOutputStream()
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), sink,
+                       compression='snappy', use_dictionary=True)
+        return pa.BufferReader(sink.getvalue())
+
+class AsyncS3Connection:
+    def __init__(self) -> None:
+        """
+        Initializes an asyncio S3 connection using AWS credentials from environment variables.
+
+        Every request is awaited on the event loop instead of blocking a thread, so many requests
+        can be in flight at once, e.g. with `asyncio.gather`. Use it as an async context manager:
+
+            async with AsyncS3Connection() as conn:
+                dfs = await asyncio.gather(*(conn.read_file_to_df(bucket, key) for key in keys))
+
+        Requires the `aiobotocore` package.
+
+        :return: None
+        """
+        if get_session is None:
+            raise ImportError("aiobotocore is required for AsyncS3Connection.")
+
+        self._credentials = _get_credentials()
+        self._client_context = None
+        self.client = None
+
+        # Bodies above the threshold are sent as a multipart upload, one part in memory at a time
+        self._multipart_threshold = 8 * MB
+        self._multipart_chunksize = 16 * MB
+
+    async def __aenter__(self) -> "AsyncS3Connection":
+        config = AioConfig(max_pool_connections=64, connect_timeout=3, read_timeout=60,
+                           retries={'mode': 'adaptive', 'max_attempts': 10})
+        self._client_context = get_session().create_client('s3', config=config, **self._credentials)
+        self.client = await self._client_context.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._client_context.__aexit__(exc_type, exc_value, traceback)
+        self.client = None
+        self._client_context = None
+
+    async def read_file_to_df(self, bucket_name: str, key: str) -> Union[pd.DataFrame, None]:
+        """
+        Reads a CSV or Parquet file from an S3 bucket and returns it as a pandas DataFrame.
+
+        Parsing runs in a worker thread so it does not stall other requests on the event loop.
+
+        :param bucket_name: The S3 bucket name
+        :param key: The CSV or Parquet file in the bucket
+        :return: A DataFrame, or None if an error occurred
+        """
+        try:
+            response = await self.client.get_object(Bucket=bucket_name, Key=key)
+            async with response['Body'] as stream:
+                data = await stream.read()
+
+            reader = pq.read_table if key.endswith('.parquet') else pa_csv.read_csv
+            return await asyncio.to_thread(lambda: reader(pa.BufferReader(data)).to_pandas(self_destruct=True))
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error reading file %s: %s", key, e)
+        except ValueError as e:
+            # Handle files that could not be parsed
+            logger.error("ValueError: %s", e)
+        return None
+
+    async def upload_to_s3(self, data: Union[str, pd.DataFrame], bucket_name: str, key: str,
+                           is_dataframe: bool = False) -> bool:
+        """
+        General method to upload either a file or a DataFrame to S3.
+
+        Behaves like `S3Connection.upload_to_s3`. Bodies above 8 MB are streamed as a multipart upload
+        in 16 MB parts, so local files are never read into memory whole and may exceed 5 GB.
+
+        :param data: A local file path, or a DataFrame when `is_dataframe` is True
+        :param bucket_name: The S3 bucket name
+        :param key: The key for the object in the bucket
+        :param is_dataframe: Whether `data` is a DataFrame
+        :return: True if the file already exists in the bucket, False if the file is uploaded
+        """
+        try:
+            await self.client.head_object(Bucket=bucket_name, Key=key)
+            logger.debug("File %s already exists in bucket %s.", key, bucket_name)
+            return True  # File exists
+        except ClientError as e:
+            if e.response['Error']['Code'] not in ('404', 'NoSuchKey', 'NotFound'):
+                logger.error("Error checking file %s: %s", key, e)
+                raise
+            logger.debug("File %s not found, uploading a new file.", key)
+
+        if is_dataframe:
+            csv_buffer = await asyncio.to_thread(S3Connection._df_to_csv_buffer, data)
+            await self._upload_fileobj(csv_buffer, bucket_name, key)
+        else:
+            with open(data, "rb") as f:  # `data` is a file path here
+                await self._upload_fileobj(f, bucket_name, key)
+        logger.debug("File uploaded as %s to bucket %s.", key, bucket_name)
+        return False  # File does not exist or uploaded
+
+    async def _upload_fileobj(self, fileobj, bucket_name: str, key: str) -> None:
+        """
+        Upload a readable binary file object, using a multipart upload above the threshold.
+
+        Parts are read in a worker thread and sent one at a time, so only one part is held in memory.
+        An unfinished multipart upload is aborted if any part fails.
+
+        :param fileobj: A seekable binary file object positioned at the start of the data
+        :param bucket_name: The S3 bucket name
+        :param key: The key for the object in the bucket
+        :return: None
+        """
+        size = fileobj.seek(0, os.SEEK_END)
+        fileobj.seek(0)
+
+        if size <= self._multipart_threshold:
+            body = await asyncio.to_thread(fileobj.read)
+            await self.client.put_object(Bucket=bucket_name, Key=key, Body=body)
+            return
+
+        # S3 allows at most 10000 parts, so grow the part size for very large bodies
+        part_size = max(self._multipart_chunksize, -(-size // 10000))
+        upload_id = (await self.client.create_multipart_upload(Bucket=bucket_name, Key=key))['UploadId']
+        try:
+            parts = []
+            while chunk := await asyncio.to_thread(fileobj.read, part_size):
+                part_number = len(parts) + 1
+                response = await self.client.upload_part(Bucket=bucket_name, Key=key, UploadId=upload_id,
+                                                         PartNumber=part_number, Body=chunk)
+                parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+            await self.client.complete_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id,
+                                                        MultipartUpload={'Parts': parts})
+        except BaseException:
+            await self.client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+            raise
+
+    async def list_files(self, bucket_name: str, prefix: str = "") -> list:
+        """
+        List all files in an S3 bucket.
+
+        :param bucket_name: The S3 bucket name
+        :param prefix: Only list keys starting with this prefix
+        :return: List of files in the bucket
+        """
+        try:
+            paginator = self.client.get_paginator('list_objects_v2')
+            files = []
+            async for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                files.extend(obj['Key'] for obj in page.get('Contents', []))
+            return files
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error listing files: %s", e)
+        return []
+
+    async def delete_file(self, bucket_name: str, key: str) -> bool:
+        """
+        Delete a file from an S3 bucket.
+
+        :param bucket_name: The S3 bucket name
+        :param key: The file to delete
+        :return: True if the file was deleted, else False
+        """
+        try:
+            await self.client.delete_object(Bucket=bucket_name, Key=key)
+            logger.debug("File %s deleted from %s", key, bucket_name)
+            return True
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Error deleting file: %s", e)
+        return False
+
 
 class RedShift:
     pass
 
 
 if __name__ == "__main__":
+    # show this module's status messages while running the example, without botocore's wire-level logs
+    logging.basicConfig()
+    logger.setLevel(logging.DEBUG)
     # instantiate the class
     conn = S3Connection()
     # create s3 bucket
@@ -342,7 +933,6 @@ if __name__ == "__main__":
     conn.upload_to_s3("test doc dataset.csv", "test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset.csv")
     # download dataset
     conn.download_file("test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset.csv", "./test doc dataset.csv")
-    # read dataset and put this in a dataframe
-    test_dataset = conn.read_file_to_df("test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset.csv")
-    # upload dataFrame
-    conn.write_df(test_dataset, "test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset.csv")
\ No newline at end of file
+    # copy dataset to a new key server-side, no need to read it into a dataframe and write it back
+    conn.relocate("test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset.csv",
+                  "test-bucket-docs-latest", "test-bucket-docs-latest/test doc dataset copy.csv")
\ No newline at end of file
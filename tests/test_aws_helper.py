@@ -0,0 +1,84 @@
+import io
+
+import boto3
+import pandas as pd
+import pytest
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
+from helper import aws_helper
+from helper.aws_helper import S3Connection
+
+
+@pytest.fixture
+def stubbed_conn():
+    conn = S3Connection.__new__(S3Connection)
+    conn.client = boto3.client("s3", region_name="us-east-1", aws_access_key_id="test",
+                               aws_secret_access_key="test")
+    with Stubber(conn.client) as stubber:
+        yield conn, stubber
+
+
+def test_df_to_csv_buffer_writes_every_slice(monkeypatch):
+    monkeypatch.setattr(aws_helper, "_CSV_BATCH_ROWS", 3)
+    df = pd.DataFrame({"a": range(10), "b": [f"row {i}" for i in range(10)]})
+
+    result = pd.read_csv(S3Connection._df_to_csv_buffer(df))
+
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_df_to_csv_buffer_writes_header_for_empty_frame():
+    result = S3Connection._df_to_csv_buffer(pd.DataFrame({"a": []})).read()
+
+    assert result.strip() == b'"a"'
+
+
+def test_df_to_csv_buffer_falls_back_to_pandas_for_mixed_types():
+    df = pd.DataFrame({"a": ["x", 1, "y"]})
+
+    result = pd.read_csv(S3Connection._df_to_csv_buffer(df))
+
+    assert result["a"].tolist() == ["x", "1", "y"]
+
+
+def test_upload_files_raises_when_listing_existing_keys_fails(stubbed_conn, tmp_path):
+    conn, stubber = stubbed_conn
+    path = tmp_path / "a.csv"
+    path.write_text("a\n1\n")
+    stubber.add_client_error("list_objects_v2", service_error_code="AccessDenied", http_status_code=403)
+
+    with pytest.raises(ClientError):
+        conn.upload_files([(str(path), "bucket", "data/a.csv"), (str(path), "bucket", "data/b.csv")])
+    stubber.assert_no_pending_responses()
+
+
+def test_read_file_to_df_matches_chunked_read(stubbed_conn):
+    conn, stubber = stubbed_conn
+    data = (b'id,name,day,flag,score\n'
+            b'1,x,2024-01-01,true,1.5\n'
+            b'2,NA,2024-01-02,False,\n'
+            b'3,"",2024-01-03,TRUE,n/a\n')
+    for _ in range(2):
+        stubber.add_response("get_object", {"Body": StreamingBody(io.BytesIO(data), len(data)),
+                                            "ResponseMetadata": {"HTTPStatusCode": 200}},
+                             {"Bucket": "bucket", "Key": "data.csv"})
+
+    whole = conn.read_file_to_df("bucket", "data.csv")
+    chunked = pd.concat(conn.read_file_to_df("bucket", "data.csv", chunksize=2), ignore_index=True)
+
+    # A chunk whose strings are all missing concatenates to object dtype, so compare values only
+    pd.testing.assert_frame_equal(whole, chunked, check_dtype=False)
+    assert whole["name"].isna().tolist() == [False, True, True]
+    assert whole["day"].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_download_file_returns_false_for_missing_local_directory(stubbed_conn, tmp_path):
+    conn, stubber = stubbed_conn
+    data = b"a\n1\n"
+    stubber.add_response("head_object", {"ContentLength": len(data)})
+    stubber.add_response("get_object", {"Body": StreamingBody(io.BytesIO(data), len(data))})
+    conn._download_cfg = aws_helper.TransferConfig(use_threads=False)
+
+    assert conn.download_file("bucket", "data.csv", str(tmp_path / "missing" / "data.csv")) is False